@@ -0,0 +1,25 @@
+import sys
+from collections import namedtuple
+
+
+# Canonical level strings shared by every result
+ERROR = sys.intern("ERROR")
+WARNING = sys.intern("WARNING")
+INFO = sys.intern("INFO")
+
+
+class Issue(namedtuple("Issue", "level node message")):
+    """
+    A single validation result or auto-fix action.
+
+    Fields:
+        - level: "ERROR" | "WARNING" | "INFO"
+        - node: node the issue refers to ("Scene" for scene-wide actions)
+        - message: description of the issue
+    """
+    # namedtuple keeps records slotted and immutable while still copying and
+    # pickling normally (works on Maya's Python 3.7/3.9 interpreters).
+    __slots__ = ()
+
+    def to_dict(self):
+        return {"level": self.level, "node": self.node, "message": self.message}
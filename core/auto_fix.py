@@ -1,6 +1,9 @@
 import maya.cmds as cmds
 import maya.mel as mel
 
+from core._result import INFO, Issue, WARNING
+from core import scene_cache
+
 
 def run_auto_fix(
     freeze_transforms=True,
@@ -11,37 +14,32 @@ def run_auto_fix(
     Runs a set of safe, production-style fixes.
 
     Returns:
-        List[Dict]: actions performed (level/node/message) for UI reporting.
+        List[Issue]: actions performed (level/node/message) for UI reporting.
     """
     actions = []
 
-    mesh_transforms = _list_mesh_transforms_long()
+    mesh_transforms = scene_cache.mesh_transforms()
 
     cmds.undoInfo(openChunk=True)
     try:
+        alive = [n for n in mesh_transforms if cmds.objExists(n)]
+
         if freeze_transforms:
-            count = 0
-            for node in mesh_transforms:
-                if not cmds.objExists(node):
-                    continue
-                # Make sure it's transformable
-                try:
-                    cmds.makeIdentity(node, apply=True, t=True, r=True, s=True, n=False, pn=True)
-                    count += 1
-                except Exception:
-                    actions.append(_warning(node, "Failed to freeze transforms"))
+            count = _apply_bulk(
+                alive,
+                lambda nodes: cmds.makeIdentity(nodes, apply=True, t=True, r=True, s=True, n=False, pn=True),
+                "Failed to freeze transforms",
+                actions,
+            )
             actions.append(_info("Scene", f"Freeze transforms attempted on {count} mesh transforms"))
 
         if center_pivots:
-            count = 0
-            for node in mesh_transforms:
-                if not cmds.objExists(node):
-                    continue
-                try:
-                    cmds.xform(node, centerPivots=True)
-                    count += 1
-                except Exception:
-                    actions.append(_warning(node, "Failed to center pivot"))
+            count = _apply_bulk(
+                alive,
+                lambda nodes: cmds.xform(nodes, centerPivots=True),
+                "Failed to center pivot",
+                actions,
+            )
             actions.append(_info("Scene", f"Center pivots attempted on {count} mesh transforms"))
 
         if delete_unused:
@@ -66,25 +64,34 @@ def run_auto_fix(
 # ---------------------------
 # Helpers
 # ---------------------------
-def _list_mesh_transforms_long():
-    meshes = cmds.ls(type="mesh", long=True) or []
-    xforms = set()
-    for shape in meshes:
+def _apply_bulk(nodes, fix, failure_message, actions):
+    """
+    Run fix(nodes) as a single command. If the batch fails (e.g. one locked
+    node), retry node by node so only the offenders are reported.
+    Returns the number of nodes the fix was applied to.
+    """
+    if not nodes:
+        return 0
+
+    try:
+        fix(nodes)
+        return len(nodes)
+    except Exception:
+        pass
+
+    count = 0
+    for node in nodes:
         try:
-            if cmds.getAttr(f"{shape}.intermediateObject"):
-                continue
+            fix(node)
+            count += 1
         except Exception:
-            pass
-
-        parent = cmds.listRelatives(shape, parent=True, fullPath=True)
-        if parent:
-            xforms.add(parent[0])
-    return sorted(xforms)
+            actions.append(_warning(node, failure_message))
+    return count
 
 
 def _info(node, message):
-    return {"level": "INFO", "node": node, "message": message}
+    return Issue(INFO, node, message)
 
 
 def _warning(node, message):
-    return {"level": "WARNING", "node": node, "message": message}
+    return Issue(WARNING, node, message)
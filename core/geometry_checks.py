@@ -1,51 +1,54 @@
+from collections import defaultdict
+
+import maya.api.OpenMaya as om2
 import maya.cmds as cmds
 
+from core._result import ERROR, Issue, WARNING
+from core.scene_cache import scene_mesh_cache
+
 
 def run_geometry_checks(max_ngon_verts=4):
     """
     Geometry integrity checks for mesh objects:
-      - non-manifold vertices/edges (polyInfo)
-      - lamina faces (polyInfo)
-      - n-gons (faces with > max_ngon_verts) (polyInfo faceToVertex)
+      - non-manifold vertices/edges (polyInfo, one call per scene)
+      - lamina faces (polyInfo, one call per scene)
+      - n-gons (faces with > max_ngon_verts) (MFnMesh face vertex counts)
       - zero-area faces (best-effort heuristic)
 
     Returns:
-        List[Dict]: validation results
+        List[Issue]: validation results
     """
     results = []
 
-    mesh_shapes = cmds.ls(type="mesh", long=True) or []
-    if not mesh_shapes:
+    # Non-intermediate shapes only
+    shapes, shape_to_transform = scene_mesh_cache()
+    if not shapes:
         return results
 
-    for shape in mesh_shapes:
-        # Skip intermediate shapes
-        try:
-            if cmds.getAttr(f"{shape}.intermediateObject"):
-                continue
-        except Exception:
-            pass
+    nmv_counts = _polyinfo_counts(shapes, shape_to_transform, nonManifoldVertices=True)
+    nme_counts = _polyinfo_counts(shapes, shape_to_transform, nonManifoldEdges=True)
+    lam_counts = _polyinfo_counts(shapes, shape_to_transform, laminaFaces=True)
 
-        transform = _parent_transform(shape)
+    for shape in shapes:
+        transform = shape_to_transform[shape]
+        ngon_faces, zero_faces = _scan_topology(shape, max_ngon_verts)
 
         # 1) Non-manifold vertices/edges
-        nmv = _polyinfo_count(transform, nonManifoldVertices=True)
-        nme = _polyinfo_count(transform, nonManifoldEdges=True)
+        nmv = nmv_counts.get(transform, 0)
+        nme = nme_counts.get(transform, 0)
         if nmv > 0 or nme > 0:
             results.append(_error(transform, f"Non-manifold geometry detected (verts: {nmv}, edges: {nme})"))
 
         # 2) Lamina faces
-        lam = _polyinfo_count(transform, laminaFaces=True)
+        lam = lam_counts.get(transform, 0)
         if lam > 0:
             results.append(_error(transform, f"Lamina faces detected: {lam}"))
 
         # 3) N-gons
-        ngon_faces = _count_ngons(transform, max_ngon_verts)
         if ngon_faces > 0:
             results.append(_warning(transform, f"N-gons detected (> {max_ngon_verts} verts): {ngon_faces}"))
 
         # 4) Zero-area faces (best-effort)
-        zero_faces = _count_zero_area_faces(transform)
         if zero_faces > 0:
             results.append(_warning(transform, f"Possible degenerate/zero-area faces: {zero_faces}"))
 
@@ -55,85 +58,123 @@ def run_geometry_checks(max_ngon_verts=4):
 # ---------------------------
 # Helpers
 # ---------------------------
-def _parent_transform(shape):
-    p = cmds.listRelatives(shape, parent=True, fullPath=True)
-    return p[0] if p else shape
-
-
-def _polyinfo_count(node, **kwargs):
+def _polyinfo_counts(shapes, shape_to_transform, **kwargs):
     """
-    Count items returned by cmds.polyInfo for a given flag.
-    Example: _polyinfo_count(node, nonManifoldVertices=True)
+    Run cmds.polyInfo once for all shapes and bucket the returned components
+    by owning transform.
+    Example: _polyinfo_counts(shapes, shape_to_transform, nonManifoldVertices=True)
+
+    Returns:
+        Dict[str, int]: transform long name -> component count
     """
+    if not shapes:
+        return {}
+
     try:
-        info = cmds.polyInfo(node, **kwargs) or []
-        return len(info)
+        info = cmds.polyInfo(shapes, **kwargs) or []
     except Exception:
-        return 0
+        # One bad mesh fails the whole batch; fall back to querying per shape
+        info = []
+        for shape in shapes:
+            try:
+                info.extend(cmds.polyInfo(shape, **kwargs) or [])
+            except Exception:
+                pass
+
+    # Components come back as "<node>.vtx[17]" (or compacted "vtx[3:9]"); the
+    # node part may be a short name, so each distinct owner is resolved to its
+    # long path only once.
+    by_owner = defaultdict(int)
+    for comp in info:
+        comp = comp.strip()
+        by_owner[comp.partition(".")[0]] += _component_count(comp)
+
+    counts = defaultdict(int)
+    for owner, n in by_owner.items():
+        long_names = cmds.ls(owner, long=True) or []
+        if not long_names:
+            continue
+        node = long_names[0]
+        counts[shape_to_transform.get(node, node)] += n
+
+    return counts
+
+
+def _component_count(comp):
+    """
+    Number of components a single (non-flattened) component string covers,
+    e.g. "geo_x.vtx[17]" -> 1, "geo_x.vtx[3:9]" -> 7.
+    """
+    _, sep, index = comp.rpartition("[")
+    if sep and ":" in index:
+        start, _, end = index.rstrip("]").partition(":")
+        try:
+            return int(end) - int(start) + 1
+        except ValueError:
+            pass
+    return 1
 
 
-def _count_ngons(transform, max_verts):
+def _scan_topology(shape, max_verts):
+    """
+    Face topology is read once and shared by the n-gon / zero-area scans.
+
+    Returns:
+        Tuple[int, int]: (n-gon faces, possibly degenerate faces)
+    """
+    counts, indices = _face_vertices(shape)
+    return _count_ngons(counts, max_verts), _count_zero_area_faces(counts, indices)
+
+
+def _face_vertices(shape):
+    """
+    Per-face vertex counts and the flat vertex index buffer for a mesh shape,
+    read in a single MFnMesh call. Returns ([], []) if the mesh can't be read.
+    """
     try:
-        face_count = cmds.polyEvaluate(transform, face=True) or 0
-        if face_count == 0:
-            return 0
-
-        ngon_count = 0
-        for i in range(face_count):
-            face = f"{transform}.f[{i}]"
-            verts = cmds.polyInfo(face, faceToVertex=True)
-            if not verts:
-                continue
-
-            parts = verts[0].split()
-            if ":" in parts:
-                idx = parts.index(":")
-                vids = parts[idx + 1:]
-            else:
-                vids = parts[2:]
-
-            if len(vids) > max_verts:
-                ngon_count += 1
-
-        return ngon_count
+        sel = om2.MSelectionList()
+        sel.add(shape)
+        fn = om2.MFnMesh(sel.getDagPath(0))
+        # Plain read of the shape's mesh data; empty meshes skip the buffer fetch
+        if fn.numPolygons == 0:
+            return [], []
+        counts, indices = fn.getVertices()
+        return list(counts), list(indices)
     except Exception:
-        return 0
+        return [], []
+
 
+def _count_ngons(counts, max_verts):
+    return sum(1 for c in counts if c > max_verts)
 
-def _count_zero_area_faces(transform):
+
+def _count_zero_area_faces(counts, indices):
     """
     Best-effort heuristic: repeated vertex ids on a face can indicate degenerate geometry.
     """
-    try:
-        face_count = cmds.polyEvaluate(transform, face=True) or 0
-        if face_count == 0:
-            return 0
-
-        degenerate = 0
-        for i in range(face_count):
-            face = f"{transform}.f[{i}]"
-            info = cmds.polyInfo(face, faceToVertex=True)
-            if not info:
-                continue
-
-            parts = info[0].split()
-            if ":" in parts:
-                idx = parts.index(":")
-                vids = parts[idx + 1:]
-            else:
-                vids = parts[2:]
-
-            if len(vids) != len(set(vids)):
-                degenerate += 1
-
-        return degenerate
-    except Exception:
-        return 0
+    degenerate = 0
+    offset = 0
+    for c in counts:
+        # Triangles and quads (the common case) are tested with plain integer
+        # compares instead of building a set per face.
+        if c == 3:
+            a, b, d = indices[offset:offset + 3]
+            dup = a == b or a == d or b == d
+        elif c == 4:
+            a, b, d, e = indices[offset:offset + 4]
+            dup = a == b or a == d or a == e or b == d or b == e or d == e
+        else:
+            dup = len(set(indices[offset:offset + c])) != c
+
+        if dup:
+            degenerate += 1
+        offset += c
+    return degenerate
 
 
 def _error(node, message):
-    return {"level": "ERROR", "node": node, "message": message}
+    return Issue(ERROR, node, message)
 
 
 def _warning(node, message):
-    return {"level": "WARNING", "node": node, "message": message}
+    return Issue(WARNING, node, message)
@@ -1,4 +1,19 @@
-import maya.cmds as cmds
+import re
+from collections import Counter
+
+import maya.api.OpenMaya as om2
+
+from core._result import ERROR, INFO, Issue, WARNING
+
+
+_UPPER_RE = re.compile(r"[A-Z]")
+
+# Static messages are shared by every issue of the same kind
+_MSG_DUP_NAME = "Duplicate object name"
+_MSG_UPPERCASE = "Object name contains uppercase letters (use lowercase)"
+_MSG_MESH_PREFIX = "Mesh transform should start with 'geo_'"
+_MSG_JOINT_PREFIX = "Joint should start with 'jnt_'"
+_MSG_GROUP_PREFIX = "Empty transform should start with 'grp_'"
 
 
 def run_naming_checks():
@@ -6,51 +21,63 @@ def run_naming_checks():
     Runs naming convention checks on the current Maya scene.
 
     Returns:
-        List[Dict]: validation results with fields:
+        List[Issue]: validation results with fields:
             - level: "ERROR" | "WARNING" | "INFO"
             - node: full DAG path to the transform
             - message: description of the issue
     """
     results = []
 
-    all_transforms = cmds.ls(type="transform", long=True)
-
-    seen_names = set()
-
-    for node in all_transforms:
-        short_name = node.split("|")[-1]
-
+    # One API DAG walk yields every transform together with the api types
+    # of its shape children (no ls/listRelatives/nodeType round-trips).
+    all_transforms = []
+    shape_map = {}
+    it = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kTransform)
+    while not it.isDone():
+        dag = it.getPath()
+        it.next()
+
+        node = dag.fullPathName()
+        all_transforms.append(node)
+        shape_map[node] = [
+            child.apiType()
+            for child in (dag.child(i) for i in range(dag.childCount()))
+            if child.hasFn(om2.MFn.kShape)
+        ]
+
+    # Duplicate short names are found up front so every clashing node is
+    # flagged, not just the ones that happen to come after the first.
+    short_names = [node.rsplit("|", 1)[-1] for node in all_transforms]
+    dupes = {name for name, count in Counter(short_names).items() if count > 1}
+
+    for node, short_name in zip(all_transforms, short_names):
         # Duplicate short names
-        if short_name in seen_names:
-            results.append(_error(node, "Duplicate object name"))
-        else:
-            seen_names.add(short_name)
+        if short_name in dupes:
+            results.append(_error(node, _MSG_DUP_NAME))
 
         # Enforce lowercase naming (studio-common rule)
-        if any(c.isupper() for c in short_name):
-            results.append(_error(node, "Object name contains uppercase letters (use lowercase)"))
+        if _UPPER_RE.search(short_name):
+            results.append(_error(node, _MSG_UPPERCASE))
 
 
         # Shape-based rules
-        shapes = cmds.listRelatives(node, shapes=True, fullPath=True) or []
+        shapes = shape_map[node]
 
         # If this transform has shapes, apply type rules
-        for shape in shapes:
-            shape_type = cmds.nodeType(shape)
-
-            if shape_type == "mesh":
+        for shape_type in shapes:
+            if shape_type == om2.MFn.kMesh:
                 if not short_name.startswith("geo_"):
-                    results.append(_warning(node, "Mesh transform should start with 'geo_'"))
+                    results.append(_warning(node, _MSG_MESH_PREFIX))
 
             # Note: joints are transforms themselves; still safe to check if encountered as shape
-            elif shape_type == "joint":
+            elif shape_type == om2.MFn.kJoint:
                 if not short_name.startswith("jnt_"):
-                    results.append(_warning(node, "Joint should start with 'jnt_'"))
+                    results.append(_warning(node, _MSG_JOINT_PREFIX))
 
         # Group rule (no shapes)
         if not shapes:
             if not short_name.startswith("grp_"):
-                results.append(_info(node, "Empty transform should start with 'grp_'"))
+                results.append(_info(node, _MSG_GROUP_PREFIX))
 
     return results
 
@@ -59,12 +86,12 @@ def run_naming_checks():
 # Result Helpers
 # ---------------------------
 def _error(node, message):
-    return {"level": "ERROR", "node": node, "message": message}
+    return Issue(ERROR, node, message)
 
 
 def _warning(node, message):
-    return {"level": "WARNING", "node": node, "message": message}
+    return Issue(WARNING, node, message)
 
 
 def _info(node, message):
-    return {"level": "INFO", "node": node, "message": message}
+    return Issue(INFO, node, message)
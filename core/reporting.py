@@ -2,17 +2,26 @@ import json
 import os
 import getpass
 import socket
+from collections import Counter
 from datetime import datetime
 
 import maya.cmds as cmds
 
+from core._result import Issue
+
+try:
+    # Optional: much faster JSON encoder that writes UTF-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def build_report(results):
     """
     Build a report dict suitable for JSON export.
 
     Args:
-        results (list[dict]): items like {"level","node","message"}
+        results (list[Issue]): validation results
 
     Returns:
         dict: report payload
@@ -21,12 +30,9 @@ def build_report(results):
     scene_name = os.path.basename(scene_path) if scene_path else "untitled"
     maya_version = cmds.about(version=True)
 
-    counts = {"ERROR": 0, "WARNING": 0, "INFO": 0}
-    for r in results or []:
-        lvl = r.get("level", "INFO")
-        if lvl not in counts:
-            counts[lvl] = 0
-        counts[lvl] += 1
+    tally = Counter(r.level for r in results or [])
+    counts = {"ERROR": tally["ERROR"], "WARNING": tally["WARNING"], "INFO": tally["INFO"]}
+    counts.update({lvl: n for lvl, n in tally.items() if lvl not in counts})
 
     report = {
         "meta": {
@@ -47,16 +53,17 @@ def build_report(results):
     return report
 
 
-def export_report_json(filepath, report_dict):
+def export_report_json(filepath, report_dict, pretty=False):
     """
     Write report_dict to filepath as JSON.
+    Output is compact unless pretty=True (2-space indent).
     """
     folder = os.path.dirname(filepath)
     if folder and not os.path.exists(folder):
         os.makedirs(folder, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(report_dict, f, indent=2, ensure_ascii=False)
+    with open(filepath, "wb") as f:
+        f.write(_json_dumps(report_dict, pretty))
 
 
 def export_report_txt(filepath, report_dict):
@@ -72,31 +79,64 @@ def export_report_txt(filepath, report_dict):
     counts = (summary.get("counts") or {})
     results = report_dict.get("results") or []
 
-    lines = []
-    lines.append("Maya Asset Validator Report")
-    lines.append("=" * 30)
-    lines.append(f"Scene: {meta.get('scene_name', '')}")
-    lines.append(f"Scene Path: {meta.get('scene_path', '')}")
-    lines.append(f"Maya Version: {meta.get('maya_version', '')}")
-    lines.append(f"User: {meta.get('user', '')}")
-    lines.append(f"Machine: {meta.get('machine', '')}")
-    lines.append(f"Timestamp: {meta.get('timestamp_local', '')}")
-    lines.append("")
-    lines.append("Summary")
-    lines.append("-" * 30)
-    lines.append(f"Total Issues: {summary.get('total', 0)}")
-    lines.append(f"ERROR: {counts.get('ERROR', 0)}")
-    lines.append(f"WARNING: {counts.get('WARNING', 0)}")
-    lines.append(f"INFO: {counts.get('INFO', 0)}")
-    lines.append("")
-    lines.append("Details")
-    lines.append("-" * 30)
-
-    for r in results:
-        lvl = r.get("level", "INFO")
-        node = r.get("node", "")
-        msg = r.get("message", "")
-        lines.append(f"[{lvl}] {node} — {msg}")
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    # Stream straight to disk; large reports never exist as one big string
+    with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write = f.write
+        write("Maya Asset Validator Report\n")
+        write("=" * 30 + "\n")
+        write(f"Scene: {meta.get('scene_name', '')}\n")
+        write(f"Scene Path: {meta.get('scene_path', '')}\n")
+        write(f"Maya Version: {meta.get('maya_version', '')}\n")
+        write(f"User: {meta.get('user', '')}\n")
+        write(f"Machine: {meta.get('machine', '')}\n")
+        write(f"Timestamp: {meta.get('timestamp_local', '')}\n")
+        write("\n")
+        write("Summary\n")
+        write("-" * 30 + "\n")
+        write(f"Total Issues: {summary.get('total', 0)}\n")
+        write(f"ERROR: {counts.get('ERROR', 0)}\n")
+        write(f"WARNING: {counts.get('WARNING', 0)}\n")
+        write(f"INFO: {counts.get('INFO', 0)}\n")
+        write("\n")
+        write("Details\n")
+        write("-" * 30 + "\n")
+
+        for r in results:
+            write(f"[{r.level}] {r.node} — {r.message}\n")
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+def _json_dumps(obj, pretty=False):
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when it is installed.
+    Issue results are written as {"level","node","message"} objects.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=_json_default)
+
+    # Issue is a namedtuple, which json writes as a plain array without ever
+    # consulting default=, so results are converted up front here.
+    obj = _issues_to_dicts(obj)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    return (text + "\n").encode("utf-8")
+
+
+def _issues_to_dicts(report_dict):
+    results = report_dict.get("results") if isinstance(report_dict, dict) else None
+    if not results:
+        return report_dict
+    return dict(report_dict, results=[r.to_dict() if isinstance(r, Issue) else r for r in results])
+
+
+def _json_default(obj):
+    if isinstance(obj, Issue):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,91 @@
+import contextlib
+import functools
+
+import maya.api.OpenMaya as om2
+
+
+# Bumped whenever a validation run starts or ends so cached scene data never
+# outlives the run that collected it.
+_generation = 0
+_run_depth = 0
+
+
+@contextlib.contextmanager
+def validation_run():
+    """
+    Share one scene_mesh_cache() result between every check called inside
+    the block. Outside of a validation run the cache is bypassed, so edits
+    made to the scene between runs are always picked up.
+    """
+    global _generation, _run_depth
+
+    if _run_depth == 0:
+        _generation += 1
+    _run_depth += 1
+    try:
+        yield
+    finally:
+        _run_depth -= 1
+        if _run_depth == 0:
+            _generation += 1
+            _cached_scene_meshes.cache_clear()
+
+
+def scene_mesh_cache():
+    """
+    Non-intermediate mesh shapes and their parent transforms, collected with
+    a single API 2.0 DAG walk.
+
+    Returns:
+        Tuple[List[str], Dict[str, str]]: (shape long names,
+            shape long name -> parent transform long name)
+    """
+    if _run_depth == 0:
+        return _collect_scene_meshes()
+    return _cached_scene_meshes(_generation)
+
+
+def mesh_transforms():
+    """
+    Long names of the transforms that directly parent non-intermediate mesh
+    shapes, in DAG order. Shares scene_mesh_cache() inside a validation run.
+
+    Returns:
+        List[str]: transform long names
+    """
+    _, shape_to_transform = scene_mesh_cache()
+    # dict as an insertion-ordered set: deterministic DAG order, no sort
+    return list(dict.fromkeys(shape_to_transform.values()))
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+@functools.lru_cache(maxsize=1)
+def _cached_scene_meshes(generation):
+    return _collect_scene_meshes()
+
+
+def _collect_scene_meshes():
+    shapes = []
+    shape_to_transform = {}
+
+    it = om2.MItDag(om2.MItDag.kDepthFirst, om2.MFn.kMesh)
+    while not it.isDone():
+        dag = it.getPath()
+        it.next()
+
+        try:
+            if om2.MFnDagNode(dag).isIntermediateObject:
+                continue
+        except Exception:
+            pass
+
+        shape = dag.fullPathName()
+        parent = om2.MDagPath(dag)
+        parent.pop()
+
+        shapes.append(shape)
+        shape_to_transform[shape] = parent.fullPathName() or shape
+
+    return shapes, shape_to_transform
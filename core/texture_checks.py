@@ -1,10 +1,21 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+import maya.api.OpenMaya as om2
 import maya.cmds as cmds
 
+from core._result import ERROR, INFO, Issue, WARNING
+from core.scene_cache import scene_mesh_cache
+
 
 _UDIM_PATTERN = re.compile(r"(?:<UDIM>|1001)")
 
+# Static messages are shared by every issue of the same kind
+_MSG_EMPTY_PATH = "Texture path is empty"
+_MSG_NO_SG = "Mesh has no shadingEngine connections (no material assignment)"
+_MSG_DEFAULT_SG = "Mesh appears to be using default material (initialShadingGroup)"
+
 
 def run_texture_checks():
     """
@@ -15,20 +26,21 @@ def run_texture_checks():
       - meshes with no material assignment beyond default (best-effort)
 
     Returns:
-        List[Dict]: validation results
+        List[Issue]: validation results
     """
     results = []
 
     # 1) File node texture path checks
+    # Paths are gathered first so the filesystem is probed once per texture
+    # directory rather than once per file node (see _existing_paths).
+    pending = []  # (file node, raw path, path to test, kind)
     file_nodes = cmds.ls(type="file") or []
-    for f in file_nodes:
-        if not cmds.objExists(f"{f}.fileTextureName"):
+    for f, path in zip(file_nodes, _file_texture_names(file_nodes)):
+        if path is None:
             continue
 
-        path = cmds.getAttr(f"{f}.fileTextureName") or ""
-
         if not path.strip():
-            results.append(_error(f, "Texture path is empty"))
+            pending.append((f, path, None, "empty"))
             continue
 
         # Normalize slashes for Windows/network paths
@@ -37,43 +49,41 @@ def run_texture_checks():
         # UDIM handling: accept <UDIM> token OR 1001-style
         if "<UDIM>" in norm:
             # Check if at least one UDIM tile exists by testing 1001 replacement
-            test_path = norm.replace("<UDIM>", "1001")
-            if not os.path.exists(test_path):
-                results.append(_warning(f, f"UDIM texture missing (checked 1001): {path}"))
-            continue
-
-        # If it contains 1001 but no <UDIM>, still treat as possible UDIM
-        if _UDIM_PATTERN.search(norm):
-            # Try exact path first
-            if os.path.exists(norm):
-                continue
-            # If 1001 present, try a basic glob-like check (1001 -> 1002) by just checking 1001
-            test_path = norm
-            if "1001" in norm and not os.path.exists(test_path):
-                results.append(_warning(f, f"Possible UDIM texture missing (1001 not found): {path}"))
+            pending.append((f, path, norm.replace("<UDIM>", "1001"), "udim"))
+        elif _UDIM_PATTERN.search(norm):
+            # Contains 1001 but no <UDIM>: still treat as possible UDIM
+            pending.append((f, path, norm, "possible_udim"))
+        else:
+            # Non-UDIM: must exist exactly
+            pending.append((f, path, norm, "file"))
+
+    found = _existing_paths([p[2] for p in pending if p[2]])
+
+    for f, path, test_path, kind in pending:
+        if kind == "empty":
+            results.append(_error(f, _MSG_EMPTY_PATH))
+        elif found[test_path]:
             continue
-
-        # Non-UDIM: must exist exactly
-        if not os.path.exists(norm):
+        elif kind == "udim":
+            results.append(_warning(f, f"UDIM texture missing (checked 1001): {path}"))
+        elif kind == "possible_udim":
+            results.append(_warning(f, f"Possible UDIM texture missing (1001 not found): {path}"))
+        else:
             results.append(_error(f, f"Missing texture file: {path}"))
 
     # 2) Mesh material assignment checks (best-effort)
     # Flag meshes using only initialShadingGroup or having no shading engine assignments
-    mesh_shapes = cmds.ls(type="mesh", long=True) or []
-    for shape in mesh_shapes:
-        if cmds.getAttr(f"{shape}.intermediateObject"):
-            continue
-
-        transform = _parent_transform(shape)
+    mesh_shapes, shape_to_transform = scene_mesh_cache()
+    for shape, sgs in zip(mesh_shapes, _shading_engines(mesh_shapes)):
+        transform = shape_to_transform[shape]
 
-        sgs = cmds.listConnections(shape, type="shadingEngine") or []
         if not sgs:
-            results.append(_warning(transform, "Mesh has no shadingEngine connections (no material assignment)"))
+            results.append(_warning(transform, _MSG_NO_SG))
             continue
 
         # If only initialShadingGroup, warn (common pipeline rule)
         if all(sg == "initialShadingGroup" for sg in sgs):
-            results.append(_info(transform, "Mesh appears to be using default material (initialShadingGroup)"))
+            results.append(_info(transform, _MSG_DEFAULT_SG))
 
     return results
 
@@ -81,18 +91,93 @@ def run_texture_checks():
 # ---------------------------
 # Helpers
 # ---------------------------
-def _parent_transform(shape):
-    p = cmds.listRelatives(shape, parent=True, fullPath=True)
-    return p[0] if p else shape
+def _file_texture_names(file_nodes):
+    """
+    fileTextureName of each file node, read from its plug through API 2.0.
+    None for nodes without the attribute.
+    """
+    sel = om2.MSelectionList()
+    for f in file_nodes:
+        sel.add(f)
+
+    paths = []
+    for i in range(sel.length()):
+        try:
+            fn = om2.MFnDependencyNode(sel.getDependNode(i))
+            paths.append(fn.findPlug("fileTextureName", False).asString() or "")
+        except Exception:
+            paths.append(None)
+    return paths
+
+
+def _shading_engines(shapes):
+    """
+    Names of the shadingEngines assigned to each mesh shape (object or
+    per-face assignments), via MFnMesh.getConnectedShaders.
+    """
+    sel = om2.MSelectionList()
+    for shape in shapes:
+        sel.add(shape)
+
+    assignments = []
+    for i in range(sel.length()):
+        try:
+            dag = sel.getDagPath(i)
+            shaders, _ = om2.MFnMesh(dag).getConnectedShaders(dag.instanceNumber())
+            assignments.append([om2.MFnDependencyNode(sg).name() for sg in shaders])
+        except Exception:
+            assignments.append([])
+    return assignments
+
+
+def _existing_paths(paths):
+    """
+    Existence test for many paths at once. Each distinct parent directory is
+    listed a single time (concurrently, since this is I/O bound on network
+    mounts) and every path becomes a set lookup.
+
+    Returns:
+        Dict[str, bool]: path -> exists
+    """
+    paths = list(dict.fromkeys(paths))
+    dirs = list(dict.fromkeys(os.path.dirname(p) or "." for p in paths))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        dir_cache = dict(zip(dirs, pool.map(_list_dir, dirs)))
+
+    found = {}
+    for p in paths:
+        name = os.path.basename(p)
+        listing = dir_cache[os.path.dirname(p) or "."]
+        if not name or listing is None:
+            # Trailing slash, or a folder that can't be listed (e.g. a
+            # traverse-only share): ask about the file itself
+            found[p] = os.path.exists(p)
+            continue
+        # A miss is confirmed with os.path.exists: normcase is a no-op on
+        # macOS, whose default filesystem is still case-insensitive
+        found[p] = os.path.normcase(name) in listing or os.path.exists(p)
+    return found
+
+
+def _list_dir(folder):
+    # normcase keeps lookups case-insensitive on Windows, like os.path.exists.
+    # None (not an empty set) when listing fails, so callers can fall back
+    # to per-file checks instead of reporting every texture as missing.
+    try:
+        with os.scandir(folder) as it:
+            return {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        return None
 
 
 def _error(node, message):
-    return {"level": "ERROR", "node": node, "message": message}
+    return Issue(ERROR, node, message)
 
 
 def _warning(node, message):
-    return {"level": "WARNING", "node": node, "message": message}
+    return Issue(WARNING, node, message)
 
 
 def _info(node, message):
-    return {"level": "INFO", "node": node, "message": message}
+    return Issue(INFO, node, message)
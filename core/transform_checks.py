@@ -1,4 +1,15 @@
-import maya.cmds as cmds
+import math
+
+import maya.api.OpenMaya as om2
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy ships with Maya 2024+; older versions use the pure Python path
+    np = None
+
+from core._result import ERROR, INFO, Issue, WARNING
+from core import scene_cache
 
 
 def run_transform_checks(
@@ -17,31 +28,57 @@ def run_transform_checks(
       - pivot_tolerance: allowed distance from bbox center
 
     Returns:
-        List[Dict]: validation results
+        List[Issue]: validation results
     """
     results = []
 
-    mesh_transforms = _list_mesh_transforms_long()
+    mesh_transforms = scene_cache.mesh_transforms()
 
+    sel = om2.MSelectionList()
     for node in mesh_transforms:
+        sel.add(node)
+
+    # The API reports distances in internal units (cm); scale them to the
+    # scene's UI unit so tolerances and messages read like getAttr/xform.
+    to_ui = om2.MDistance.internalToUI(1.0)
+
+    # Read phase: one row of (translate, rotate, scale - 1) per transform
+    rows = []
+    pivots = []
+    for i in range(len(mesh_transforms)):
+        dag = sel.getDagPath(i)
+
         # --- Transform values ---
-        t = cmds.getAttr(f"{node}.translate")[0]  # (x,y,z)
-        r = cmds.getAttr(f"{node}.rotate")[0]
-        s = cmds.getAttr(f"{node}.scale")[0]
+        fn = om2.MFnTransform(dag)
+        tv = fn.translation(om2.MSpace.kTransform)
+        rv = fn.rotation()  # MEulerRotation in radians; .rotate is in degrees
+        s = fn.scale()
+        rows.append((
+            tv.x * to_ui, tv.y * to_ui, tv.z * to_ui,
+            math.degrees(rv.x), math.degrees(rv.y), math.degrees(rv.z),
+            s[0] - 1.0, s[1] - 1.0, s[2] - 1.0,
+        ))
 
-        if _abs_any_gt(t, translate_tolerance):
+        # --- Pivot vs bbox center ---
+        pivots.append((_bbox_center_world(dag, to_ui), _rotate_pivot_world(dag, to_ui)))
+
+    tols = (translate_tolerance,) * 3 + (rotate_tolerance,) * 3 + (scale_tolerance,) * 3
+    flags = _tolerance_flags(rows, tols)
+
+    for node, row, (t_bad, r_bad, s_bad), (bbox_center, pivot) in zip(mesh_transforms, rows, flags, pivots):
+        t = row[0:3]
+        r = row[3:6]
+        s = (row[6] + 1.0, row[7] + 1.0, row[8] + 1.0)
+
+        if t_bad:
             results.append(_warning(node, f"Translate not zero: {tuple(round(v, 4) for v in t)}"))
 
-        if _abs_any_gt(r, rotate_tolerance):
+        if r_bad:
             results.append(_warning(node, f"Rotate not zero: {tuple(round(v, 3) for v in r)}"))
 
-        if _abs_any_gt((s[0] - 1.0, s[1] - 1.0, s[2] - 1.0), scale_tolerance):
+        if s_bad:
             results.append(_warning(node, f"Scale not one: {tuple(round(v, 4) for v in s)}"))
 
-        # --- Pivot vs bbox center ---
-        bbox_center = _bbox_center_world(node)
-        pivot = _rotate_pivot_world(node)
-
         if bbox_center and pivot:
             dist = _distance(bbox_center, pivot)
             if dist > pivot_tolerance:
@@ -58,43 +95,30 @@ def run_transform_checks(
 # ---------------------------
 # Helpers
 # ---------------------------
-def _list_mesh_transforms_long():
+def _bbox_center_world(dag, to_ui=1.0):
     """
-    Returns long-path transform nodes that directly parent mesh shapes.
-    """
-    meshes = cmds.ls(type="mesh", long=True) or []
-    xforms = set()
-
-    for shape in meshes:
-        parent = cmds.listRelatives(shape, parent=True, fullPath=True)
-        if parent:
-            xforms.add(parent[0])
-
-    return sorted(xforms)
-
-
-def _bbox_center_world(node):
-    """
-    World-space bbox center from exactWorldBoundingBox.
-    Returns (x,y,z) or None.
+    World-space bbox center of a transform and everything under it (same
+    extent exactWorldBoundingBox and centerPivots use), from the node's API
+    bounding box. Returns (x,y,z) in UI units or None.
     """
     try:
-        bb = cmds.exactWorldBoundingBox(node)  # [xmin,ymin,zmin,xmax,ymax,zmax]
-        cx = (bb[0] + bb[3]) * 0.5
-        cy = (bb[1] + bb[4]) * 0.5
-        cz = (bb[2] + bb[5]) * 0.5
-        return (cx, cy, cz)
+        # A transform's boundingBox is already in its parent's space (it
+        # includes the node's own matrix); only the parents are left to apply.
+        bb = om2.MFnDagNode(dag).boundingBox
+        bb.transformUsing(dag.exclusiveMatrix())
+        c = bb.center
+        return (c.x * to_ui, c.y * to_ui, c.z * to_ui)
     except Exception:
         return None
 
 
-def _rotate_pivot_world(node):
+def _rotate_pivot_world(dag, to_ui=1.0):
     """
-    World-space rotate pivot. Returns (x,y,z) or None.
+    World-space rotate pivot. Returns (x,y,z) in UI units or None.
     """
     try:
-        rp = cmds.xform(node, q=True, ws=True, rp=True)  # [x,y,z]
-        return (rp[0], rp[1], rp[2])
+        rp = om2.MFnTransform(dag).rotatePivot(om2.MSpace.kWorld)
+        return (rp.x * to_ui, rp.y * to_ui, rp.z * to_ui)
     except Exception:
         return None
 
@@ -106,17 +130,37 @@ def _distance(a, b):
     return (dx*dx + dy*dy + dz*dz) ** 0.5
 
 
+def _tolerance_flags(rows, tols):
+    """
+    For each 9-value row (translate, rotate, scale - 1) return
+    (translate_bad, rotate_bad, scale_bad), comparing |value| > tolerance.
+    Uses a single vectorized numpy compare over all rows when available.
+    """
+    if not rows:
+        return []
+
+    if np is not None:
+        mask = np.abs(np.array(rows, dtype=np.float64)) > np.array(tols, dtype=np.float64)
+        bad = np.stack((mask[:, 0:3].any(axis=1), mask[:, 3:6].any(axis=1), mask[:, 6:9].any(axis=1)), axis=1)
+        return bad.tolist()
+
+    return [
+        (_abs_any_gt(row[0:3], tols[0]), _abs_any_gt(row[3:6], tols[3]), _abs_any_gt(row[6:9], tols[6]))
+        for row in rows
+    ]
+
+
 def _abs_any_gt(vals, tol):
     return any(abs(v) > tol for v in vals)
 
 
 def _error(node, message):
-    return {"level": "ERROR", "node": node, "message": message}
+    return Issue(ERROR, node, message)
 
 
 def _warning(node, message):
-    return {"level": "WARNING", "node": node, "message": message}
+    return Issue(WARNING, node, message)
 
 
 def _info(node, message):
-    return {"level": "INFO", "node": node, "message": message}
+    return Issue(INFO, node, message)
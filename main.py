@@ -13,4 +13,8 @@ def run():
     if "ui.validator_ui" in sys.modules:
         importlib.reload(ui.validator_ui)
 
+    # The dialog class lives in its own lazily imported module
+    if "ui.validator_dialog" in sys.modules:
+        importlib.reload(sys.modules["ui.validator_dialog"])
+
     ui.validator_ui.show()
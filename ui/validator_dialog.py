@@ -0,0 +1,550 @@
+import contextlib
+import functools
+import itertools
+import os
+import re
+import traceback
+
+from core._result import Issue
+from ui.validator_ui import QtCore, QtGui, QtWidgets, get_maya_main_window
+
+
+# Max (severity, query) combinations remembered by apply_filters
+_FILTER_CACHE_SIZE = 32
+
+_EXPORT_FILTERS = "JSON Report (*.json);;Text Report (*.txt)"
+
+# Result colors, built once (Qt is already resolved when this module loads)
+_BRUSH_ERROR = QtGui.QBrush(QtGui.QColor("red"))
+_BRUSH_WARNING = QtGui.QBrush(QtGui.QColor("orange"))
+_BRUSH_INFO = QtGui.QBrush(QtGui.QColor("white"))
+# level -> (brush, display prefix); unknown levels fall back to INFO colors
+_LEVEL_TABLE = {
+    "ERROR": (_BRUSH_ERROR, "[ERROR] "),
+    "WARNING": (_BRUSH_WARNING, "[WARNING] "),
+    "INFO": (_BRUSH_INFO, "[INFO] "),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _maya_main_window_cached():
+    # Maya's main window lives for the whole session; wrap it only once
+    return get_maya_main_window()
+
+
+def _level_style(level):
+    return _LEVEL_TABLE.get(level) or (_BRUSH_INFO, f"[{level}] ")
+
+
+def _set_gray_text(label):
+    # Palette color instead of a stylesheet: later setText calls skip the
+    # style sheet cascade entirely.
+    pal = label.palette()
+    pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor("gray"))
+    label.setPalette(pal)
+    label.setForegroundRole(QtGui.QPalette.WindowText)
+
+
+class _ResultsModel(QtCore.QAbstractListModel):
+    """
+    List model over Issue rows. Text and colors are produced on demand in
+    data(), so only the rows the view actually paints are ever formatted,
+    and replacing the rows is a single model reset.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        r = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            prefix = _level_style(r.level)[1]
+            if r.node:
+                return prefix + r.node + " — " + r.message
+            return prefix + r.message
+        if role == QtCore.Qt.ForegroundRole:
+            return _level_style(r.level)[0]
+        if role == QtCore.Qt.UserRole:
+            # Node for double-click selection
+            return r.node
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)  # own copy; callers' lists are cached/shared
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_rows([])
+
+
+class _JobSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)  # list of results
+    failed = QtCore.Signal(str)
+
+
+class _MayaJob(QtCore.QRunnable):
+    """
+    Runs core.* callables from a QThreadPool worker and reports their
+    concatenated results through queued signals.
+
+    maya.cmds is not thread-safe, so the scope and every callable run inside
+    a single executeInMainThreadWithResult call. Handing the main thread back
+    between checks would let the scene be edited mid-run, leaving later
+    checks with node paths cached by earlier ones. The click handler still
+    returns first, so the busy state is painted before the scene is walked.
+    """
+    def __init__(self, funcs, scope=None):
+        super().__init__()
+        self.funcs = funcs
+        self.scope = scope
+        self.signals = _JobSignals()
+
+    def run(self):
+        import maya.utils
+
+        try:
+            results = maya.utils.executeInMainThreadWithResult(self._run_all)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(results)
+
+    def _run_all(self):
+        # Main thread. Checks run one after another: they all share maya.cmds,
+        # so they can't run side by side.
+        try:
+            with self.scope() if self.scope else contextlib.nullcontext():
+                return list(itertools.chain.from_iterable(func() for func in self.funcs))
+        except Exception:
+            # Full traceback to the Script Editor; the dialog only shows str(e)
+            traceback.print_exc()
+            raise
+
+
+class AssetValidatorUI(QtWidgets.QDialog):
+    def __init__(self, parent=None):
+        if parent is None:
+            parent = _maya_main_window_cached()
+        super().__init__(parent)
+
+        self.setWindowTitle("Maya Asset Validator")
+        self.setMinimumSize(500, 400)
+        self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint)
+
+        self.last_results = []
+        self.filtered_results = []
+        # Derived from last_results by _refresh_result_cache
+        self._counts = {"ERROR": 0, "WARNING": 0, "INFO": 0}
+        self._total = 0
+        self._index = []  # (level, "level node message" search haystack) per result
+        # (severity, query) -> filtered results; reset whenever last_results changes
+        self._filter_cache = {}
+        # Results currently in the view; None once add_result/clear changed it
+        self._shown_results = None
+
+        # Remembered between exports so the save dialog reopens in place
+        self._last_export_dir = ""
+        self._last_export_filter = ""
+
+        # Auto Fix confirmation, built lazily by _confirm_autofix_dialog
+        self._confirm_autofix_box = None
+
+        # Running _MayaJob (kept referenced until it reports back)
+        self._job = None
+
+        # core.* entry points and maya.cmds, filled by _warm_imports
+        self._checks = None
+        self._validation_run = None
+        self._run_auto_fix = None
+        self._reporting = None
+        self._cmds = None
+
+        # Debounce search typing: only the last keystroke in a burst filters
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+
+        self.build_ui()
+        self.connect_signals()
+
+        # Load the check modules as soon as the window is up rather than on
+        # the first click
+        QtCore.QTimer.singleShot(0, self._warm_imports)
+        
+    def run_auto_fix(self):
+        self._warm_imports()
+    
+        # Confirmation dialog
+        box = self._confirm_autofix_dialog()
+        # exec() on PySide6 (exec_ is deprecated there), exec_() on PySide2
+        run = getattr(box, "exec", None) or box.exec_
+    
+        if run() != QtWidgets.QMessageBox.Yes:
+            self.status_label.setText("Auto Fix cancelled")
+            return
+    
+        self.status_label.setText("Running Auto Fix...")
+        self._start_job((self._run_auto_fix,), self._on_auto_fix_done)
+
+    def _confirm_autofix_dialog(self):
+        # Built on first use and reused for every later Auto Fix
+        if self._confirm_autofix_box is None:
+            box = QtWidgets.QMessageBox(self)
+            box.setIcon(QtWidgets.QMessageBox.Question)
+            box.setWindowTitle("Confirm Auto Fix")
+            box.setText(
+                "Auto Fix will attempt to:\n"
+                "• Freeze transforms (mesh objects)\n"
+                "• Center pivots (mesh objects)\n"
+                "• Delete unused nodes\n\n"
+                "This is undoable with a single Ctrl+Z.\n\n"
+                "Continue?"
+            )
+            box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+            self._confirm_autofix_box = box
+        return self._confirm_autofix_box
+
+    def _on_auto_fix_done(self, actions):
+        self._finish_job()
+
+        # Show what happened
+        for a in actions:
+            msg = f"{a.node} — {a.message}"
+            self.add_result(a.level, msg)
+    
+        self.status_label.setText("Auto Fix complete")
+
+    def export_report(self):
+        self._warm_imports()
+        reporting = self._reporting
+    
+        if not getattr(self, "last_results", None):
+            QtWidgets.QMessageBox.information(
+                self,
+                "No Results",
+                "Nothing to export yet. Run Validate Scene first."
+            )
+            return
+    
+        report = reporting.build_report(self.last_results)
+    
+        # Choose path + format (reopen where the last report was saved)
+        ext = ".txt" if "Text Report" in self._last_export_filter else ".json"
+        default_name = f"{report['meta']['scene_name']}_validation_report{ext}"
+    
+        filepath, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Save Validation Report",
+            os.path.join(self._last_export_dir, default_name),
+            _EXPORT_FILTERS,
+            self._last_export_filter,
+        )
+    
+        if not filepath:
+            self.status_label.setText("Export cancelled")
+            return
+    
+        try:
+            if filepath.lower().endswith(".txt") or "Text Report" in selected_filter:
+                # ensure extension
+                if not filepath.lower().endswith(".txt"):
+                    filepath += ".txt"
+                reporting.export_report_txt(filepath, report)
+            else:
+                if not filepath.lower().endswith(".json"):
+                    filepath += ".json"
+                reporting.export_report_json(filepath, report)
+    
+            self._last_export_dir = os.path.dirname(filepath)
+            self._last_export_filter = selected_filter or self._last_export_filter
+            self.status_label.setText(f"Report saved: {filepath}")
+            self.add_result("INFO", f"Report exported to: {filepath}")
+    
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(
+                self,
+                "Export Failed",
+                f"Could not export report:\n{e}"
+            )
+            self.status_label.setText("Export failed")
+    
+    def apply_filters(self):
+        # Filter settings
+        severity = self.severity_filter.currentText()
+        query = self.search_box.text().strip()
+    
+        # Summary (counts are computed once per result set)
+        counts = self._counts
+        self.summary_label.setText(
+            f"ERROR: {counts['ERROR']} | WARNING: {counts['WARNING']} | INFO: {counts['INFO']} | Total: {self._total}"
+        )
+    
+        # Apply filters
+        filtered = self._filter_results(severity, query)
+        self.filtered_results = filtered
+    
+        # Typing often narrows to the same rows (or the same cached list);
+        # leave the view alone then. List equality short-circuits on
+        # identical Issue objects, so this is a cheap pointer walk.
+        if filtered == self._shown_results:
+            return
+        self._shown_results = filtered
+
+        # Rebuild UI list (one model reset)
+        if filtered:
+            self._model.set_rows(filtered)
+        else:
+            self._model.set_rows([Issue("INFO", "", "No results match current filters")])
+
+    def _filter_results(self, severity, query):
+        """
+        Results matching the severity/query filters. With no active filter
+        last_results is returned as-is; otherwise the scan is memoized per
+        (severity, query) until last_results changes.
+        """
+        if severity == "All" and not query:
+            return self.last_results
+
+        # Matching is case-insensitive, so the cache key is too
+        key = (severity, query.lower())
+        filtered = self._filter_cache.get(key)
+        if filtered is None:
+            # IGNORECASE search avoids lowercasing every haystack per keystroke
+            search = re.compile(re.escape(query), re.IGNORECASE).search if query else None
+
+            results = self.last_results
+            filtered = []
+            for i, (lvl, hay) in enumerate(self._index):
+                if severity != "All" and lvl != severity:
+                    continue
+
+                if search and not search(hay):
+                    continue
+
+                filtered.append(results[i])
+
+            if len(self._filter_cache) >= _FILTER_CACHE_SIZE:
+                # FIFO eviction (dicts keep insertion order)
+                del self._filter_cache[next(iter(self._filter_cache))]
+            self._filter_cache[key] = filtered
+
+        return filtered
+
+    def on_result_double_clicked(self, index):
+        node = index.data(QtCore.Qt.UserRole)
+        if not node:
+            return
+    
+        self._warm_imports()
+        cmds = self._cmds
+    
+        if cmds.objExists(node):
+            cmds.select(node, r=True)
+            self.status_label.setText(f"Selected: {node}")
+        else:
+            self.status_label.setText("Object no longer exists in scene")
+
+    def clear_results(self):
+        self._model.clear()
+        self._shown_results = None
+        self.last_results = []
+        self.filtered_results = []
+        self._refresh_result_cache()
+        if hasattr(self, "summary_label"):
+            self.summary_label.setText("ERROR: 0 | WARNING: 0 | INFO: 0 | Total: 0")
+        self.status_label.setText("Results cleared")
+
+
+    # ---------------------------
+    # UI Construction
+    # ---------------------------
+    def build_ui(self):
+        main_layout = QtWidgets.QVBoxLayout(self)
+
+        # Header
+        header = QtWidgets.QLabel("Asset Validation Tool")
+        header.setStyleSheet("font-size: 16px; font-weight: bold;")
+        main_layout.addWidget(header)
+
+        # --- Filters Row ---
+        filter_layout = QtWidgets.QHBoxLayout()
+
+        self.severity_filter = QtWidgets.QComboBox()
+        self.severity_filter.addItems(["All", "ERROR", "WARNING", "INFO"])
+
+        self.search_box = QtWidgets.QLineEdit()
+        self.search_box.setPlaceholderText("Search results... (node, message)")
+
+        filter_layout.addWidget(QtWidgets.QLabel("Filter:"))
+        filter_layout.addWidget(self.severity_filter)
+        filter_layout.addSpacing(10)
+        filter_layout.addWidget(self.search_box)
+
+        main_layout.addLayout(filter_layout)
+
+        # --- Summary ---
+        self.summary_label = QtWidgets.QLabel("ERROR: 0 | WARNING: 0 | INFO: 0 | Total: 0")
+        _set_gray_text(self.summary_label)
+        main_layout.addWidget(self.summary_label)
+
+        # Buttons
+        button_layout = QtWidgets.QHBoxLayout()
+
+        self.validate_btn = QtWidgets.QPushButton("Validate Scene")
+        self.clear_btn = QtWidgets.QPushButton("Clear Results")
+        self.autofix_btn = QtWidgets.QPushButton("Auto Fix")
+        self.export_btn = QtWidgets.QPushButton("Export Report")
+
+        button_layout.addWidget(self.validate_btn)
+        button_layout.addWidget(self.autofix_btn)
+        button_layout.addWidget(self.export_btn)
+        button_layout.addWidget(self.clear_btn)
+        button_layout.addStretch()
+
+        main_layout.addLayout(button_layout)
+
+        # Results list (model/view: only visible rows are laid out and painted)
+        self._model = _ResultsModel(self)
+        self.results_list = QtWidgets.QListView()
+        self.results_list.setModel(self._model)
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        main_layout.addWidget(self.results_list)
+
+        # Status bar
+        self.status_label = QtWidgets.QLabel("Ready")
+        _set_gray_text(self.status_label)
+        main_layout.addWidget(self.status_label)
+
+    # ---------------------------
+    # Signal Connections
+    # ---------------------------
+    def connect_signals(self):
+        self.validate_btn.clicked.connect(self.run_validation)
+        self.autofix_btn.clicked.connect(self.run_auto_fix)
+        self.clear_btn.clicked.connect(self.clear_results)
+        self.export_btn.clicked.connect(self.export_report)
+        self.severity_filter.currentIndexChanged.connect(self.apply_filters)
+        # (lambda drops the text argument so start() isn't read as start(msec))
+        self.search_box.textChanged.connect(lambda _text: self._filter_timer.start())
+        self.results_list.doubleClicked.connect(self.on_result_double_clicked)
+
+
+    # ---------------------------
+    # Validation Logic
+    # ---------------------------
+    def _warm_imports(self):
+        """
+        Import the core modules once and keep their entry points on self.
+        Scheduled right after construction; also called defensively by the
+        handlers that need them.
+        """
+        if self._checks is not None:
+            return
+
+        import maya.cmds
+        from core import auto_fix, reporting, scene_cache
+        from core.naming_checks import run_naming_checks
+        from core.transform_checks import run_transform_checks
+        from core.geometry_checks import run_geometry_checks
+        from core.texture_checks import run_texture_checks
+
+        self._checks = (
+            run_naming_checks,
+            run_transform_checks,
+            run_geometry_checks,
+            run_texture_checks,
+        )
+        self._validation_run = scene_cache.validation_run
+        self._cmds = maya.cmds
+        self._run_auto_fix = auto_fix.run_auto_fix
+        self._reporting = reporting
+
+    def _refresh_result_cache(self):
+        """
+        Recompute what is derived from last_results (summary counts and the
+        per-result search index) and drop memoized filter results. Call after
+        replacing last_results.
+        """
+        counts = {"ERROR": 0, "WARNING": 0, "INFO": 0}
+        index = []
+        for r in self.last_results:
+            lvl = r.level
+            counts[lvl] = counts.get(lvl, 0) + 1
+            index.append((lvl, f"{lvl} {r.node or ''} {r.message or ''}"))
+
+        self._counts = counts
+        self._index = index
+        self._total = len(self.last_results)
+        self._filter_cache.clear()
+
+    def run_validation(self):
+        self._warm_imports()
+    
+        self._model.clear()
+        self._shown_results = None
+        self.status_label.setText("Running validation...")
+        self._start_job(self._checks, self._on_validation_done, scope=self._validation_run)
+
+    def _on_validation_done(self, results):
+        self._finish_job()
+
+        self.last_results = results
+        self._refresh_result_cache()
+        self.apply_filters()
+    
+        self.status_label.setText("Validation complete")
+
+    def add_result(self, level, message):
+        self._model.append_rows([Issue(level, "", message)])
+        self._shown_results = None
+
+    # ---------------------------
+    # Background Jobs
+    # ---------------------------
+    def _start_job(self, funcs, on_done, scope=None):
+        self._set_busy(True)
+
+        job = _MayaJob(funcs, scope)
+        job.signals.finished.connect(on_done)
+        job.signals.failed.connect(self._on_job_failed)
+        self._job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _finish_job(self):
+        self._job = None
+        self._set_busy(False)
+
+    def _on_job_failed(self, message):
+        self._finish_job()
+        self.status_label.setText(f"Failed: {message}")
+
+    def _set_busy(self, busy):
+        # Filters too: they would refill the cleared view with the previous
+        # run's results while the new one is in progress.
+        widgets = (
+            self.validate_btn, self.autofix_btn, self.export_btn, self.clear_btn,
+            self.severity_filter, self.search_box,
+        )
+        for widget in widgets:
+            widget.setEnabled(not busy)
+        if busy:
+            # Drop a search keystroke still waiting on the debounce timer
+            self._filter_timer.stop()